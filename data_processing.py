@@ -3,9 +3,9 @@ This module contains data processing tools (e.g., finding the max, min, average,
 to work on performance evaluation results.
 """
 
-import statistics
 import itertools
-from typing import List, Iterator, Tuple
+from typing import List
+import numpy
 from data_types import SpreadingRatio, BestAndWorstLists, InvalidInputError
 
 
@@ -80,23 +80,24 @@ def find_best_worst_lists(sequence_of_lists: List[SpreadingRatio]) -> BestAndWor
             break
         last_effective_idx -= 1
 
-    # Note that the iterator construction will never raise the IndexError exception, but when it
-    # is used the error is thrown. This is why the try statement goes after iterator
-    # initialization but when they are used.
-
-    iterators: Tuple[Iterator[SpreadingRatio], ...] = itertools.tee(
-        (item for item in sequence_of_lists if item[last_effective_idx] is not None), 2
-    )
+    # The lists whose entry at last_effective_idx is not None are collected once, and max() and
+    # min() go through this collection, rather than filtering the input twice.
+    # If all entries are None, last_effective_idx has gone beyond the head of the lists (or the
+    # lists are empty), and IndexError is raised when it is used.
 
     try:
-        best_list: SpreadingRatio = max(
-            iterators[0], key=lambda x: x[last_effective_idx]
-        )
-        worst_list: SpreadingRatio = min(
-            iterators[1], key=lambda x: x[last_effective_idx]
-        )
+        candidate_lists: List[SpreadingRatio] = [
+            item for item in sequence_of_lists if item[last_effective_idx] is not None
+        ]
     except IndexError:
         raise ValueError("All entries are None. Invalid to compare.")
+
+    best_list: SpreadingRatio = max(
+        candidate_lists, key=lambda x: x[last_effective_idx]
+    )
+    worst_list: SpreadingRatio = min(
+        candidate_lists, key=lambda x: x[last_effective_idx]
+    )
     return BestAndWorstLists(best=best_list, worst=worst_list)
 
 
@@ -131,21 +132,23 @@ def average_lists(sequence_of_lists: List[SpreadingRatio]) -> List[float]:
         if len(sequence_of_lists[i]) != len(sequence_of_lists[0]):
             raise ValueError("Input lists are of different length.")
 
-    average_list: List[float] = [0.0 for _ in range(len(sequence_of_lists[0]))]
-    length_of_list: int = len(average_list)
+    # We go through all lists once, accumulating the sum and the number of non-None values for
+    # each place, rather than collecting the values of each place into a new list and calling
+    # statistics.mean() on it.
+    length_of_list: int = len(sequence_of_lists[0])
+    sum_list: List[float] = [0.0] * length_of_list
+    count_list: List[int] = [0] * length_of_list
 
-    idx: int = 0
-    while idx < length_of_list:
-        processing_list: List[float] = []
-        for any_list in sequence_of_lists:
-            list_item = any_list[idx]
+    for any_list in sequence_of_lists:
+        for idx, list_item in enumerate(any_list):
             if list_item is not None:
-                processing_list.append(list_item)
-        try:
-            average_list[idx] = statistics.mean(processing_list)
-        except statistics.StatisticsError:
-            average_list[idx] = 0.0
-        idx += 1
+                sum_list[idx] += list_item
+                count_list[idx] += 1
+
+    average_list: List[float] = [
+        value_sum / count if count else 0.0
+        for value_sum, count in zip(sum_list, count_list)
+    ]
 
     return average_list
 
@@ -176,20 +179,22 @@ def calculate_density(
     if not 0 <= division_unit <= 1:
         raise ValueError("Invalid division unit.")
 
-    total_points: int = sum(len(single_list) for single_list in sequence_of_lists)
+    # All values are put into one numpy array, and they are binned by numpy.bincount() in one
+    # call, rather than one by one in Python.
+    values: numpy.ndarray = numpy.fromiter(
+        itertools.chain.from_iterable(sequence_of_lists), dtype=float
+    )
+    total_points: int = values.size
+    if total_points == 0:
+        raise ValueError("There is no data in any input lists.")
 
     largest_index: int = int(1 / division_unit)
-    count_list: List[int] = [0 for _ in range(largest_index + 1)]
-
-    for single_list in sequence_of_lists:
-        for value in single_list:
-            try:
-                count_list[int(value / division_unit)] += 1
-            except IndexError:
-                raise ValueError("Some input data is out of range.")
-    try:
-        density_list: List[float] = [value / total_points for value in count_list]
-    except ZeroDivisionError:  # total_points == 0
-        raise ValueError("There is no data in any input lists.")
+    # int() and astype() both truncate towards zero, so values are put into the same intervals.
+    indices: numpy.ndarray = (values / division_unit).astype(numpy.int64)
+    if indices.min() < 0 or indices.max() > largest_index:
+        raise ValueError("Some input data is out of range.")
+    count_list: numpy.ndarray = numpy.bincount(indices, minlength=largest_index + 1)
+
+    density_list: List[float] = (count_list / total_points).tolist()
 
     return density_list
@@ -286,10 +286,16 @@ class Engine:
                 f"No such option to decide beneficiaries: {self.beneficiary_option['method']}"
             )
 
-        # update the contribution queue since it is the end of a calculation circle
+        # update the contribution record since it is the end of a calculation circle: move the
+        # head to the oldest entry and overwrite it by the contribution of the current batch,
+        # and then reset the current contribution for the next batch.
+        history_length: int = self.score_length - 1
         for neighbor in peer.peer_neighbor_mapping.values():
-            neighbor.share_contribution.popleft()
-            neighbor.share_contribution.append(0)
+            if history_length:
+                head: int = (neighbor.head + 1) % history_length
+                neighbor.share_contribution[head] = neighbor.current_contribution
+                neighbor.head = head
+            neighbor.current_contribution = 0.0
 
         return neighbors_selected
 
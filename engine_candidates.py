@@ -2,8 +2,10 @@
 This module contains all possible realizations of functions in the Engine class.
 """
 
+import heapq
+import operator
 import random
-from typing import Set, List, TYPE_CHECKING
+from typing import Dict, Set, List, Tuple, TYPE_CHECKING
 from data_types import Preference, Priority
 
 if TYPE_CHECKING:
@@ -67,10 +69,13 @@ def store_first(peer: "Peer") -> None:
     #   order_b: [orderinfo_b1, orderinfo_b2] }.
     # We will use "orderinfo_list" to refer to lists like [orderinfo_a1, orderinfo_a2].
 
+    # The rest orderinfo instances (if any) in orderinfo_list are not stored. There is no need to
+    # set their storage_decision to False explicitly: it is False by default when an orderinfo
+    # instance is created, and this function never sets it to True for anything other than the
+    # first element (new orderinfo instances are always appended to the end of the list).
+
     for orderinfo_list in peer.order_pending_orderinfo_mapping.values():
         orderinfo_list[0].storage_decision = True  # first orderinfo is stored
-        for orderinfo in orderinfo_list[1:]:  # the rest (if any) are not stored
-            orderinfo.storage_decision = False
 
 
 def share_all_new_selected_old(
@@ -89,36 +94,61 @@ def share_all_new_selected_old(
     """
 
     new_order_set: Set["Order"] = peer.new_order_set
-    old_order_set: Set["Order"] = set(peer.order_orderinfo_mapping) - peer.new_order_set
-    selected_order_set: Set["Order"] = set()
+    old_order_set: Set["Order"] = peer.old_order_set
 
-    selected_order_set |= set(
-        random.sample(new_order_set, min(max_to_share, len(new_order_set)))
-    )
+    # Sampling is only needed if we are selecting a strict subset. In the common case where the
+    # quota covers all new orders (or no old order is to be shared), we skip converting the set
+    # into a list and sampling it.
+
+    selected_order_set: Set["Order"]
+    if max_to_share >= len(new_order_set):
+        selected_order_set = set(new_order_set)
+    else:
+        selected_order_set = set(random.sample(list(new_order_set), max_to_share))
 
     remaining_share_size: int = max(0, max_to_share - len(new_order_set))
     probability_selection_size: int = round(len(old_order_set) * old_prob)
-    selected_order_set |= set(
-        random.sample(
-            old_order_set, min(remaining_share_size, probability_selection_size)
-        )
-    )
+    old_share_size: int = min(remaining_share_size, probability_selection_size)
+    if old_share_size >= len(old_order_set):
+        selected_order_set |= old_order_set
+    elif old_share_size > 0:
+        selected_order_set.update(random.sample(list(old_order_set), old_share_size))
     return selected_order_set
 
 
 def weighted_sum(discount: List[float], peer: "Peer") -> None:
     """
     This is a candidate design for calculating the scores of neighbors of the peer. It calculates
-    the current score by a weighted sum of all elements in the queue.
-    Note, the queue is not updated here; it is updated in engine.find_neighbors_to_share().
-    :param discount: a list of weights for each element of the score queue. The score is a
-    weighted sum of the elements in the queue.
+    the current score by a weighted sum of all elements in the contribution record, i.e., the
+    contributions in the previous batches and the current one.
+    Note, the record is not updated here; it is updated in engine.find_neighbors_to_share().
+    :param discount: a list of weights for each element of the record, from the oldest batch to
+    the current one. The score is a weighted sum of the elements in the record.
     :param peer: the peer instance of the node that does the calculation.
     :return: None. The score is recorded in neighbor.score
     """
+    # The last weight is for the current batch (neighbor.current_contribution), and the other
+    # weights are for the previous batches (neighbor.share_contribution).
+    # The record of previous batches is a circular buffer; the oldest entry is the one right after
+    # the head. Instead of re-arranging every neighbor's record into chronological order, we
+    # rotate the weights once for each possible head position, so that rotated_discount[head][i]
+    # is the weight of share_contribution[i] of a neighbor whose head is at that position. Each
+    # record is then read exactly once, in place.
+    current_weight: float = discount[-1]
+    history_discount: List[float] = discount[:-1]
+    history_length: int = len(history_discount)
+    rotated_discount: List[List[float]] = [
+        history_discount[history_length - 1 - head :]
+        + history_discount[: history_length - 1 - head]
+        for head in range(max(history_length, 1))
+    ]
     for neighbor in peer.peer_neighbor_mapping.values():
-        neighbor.score = sum(
-            a * b for a, b in zip(neighbor.share_contribution, discount)
+        neighbor.score = current_weight * neighbor.current_contribution + sum(
+            map(
+                operator.mul,
+                neighbor.share_contribution,
+                rotated_discount[neighbor.head],
+            )
         )
 
 
@@ -138,10 +168,11 @@ def remove_lazy_neighbors(
     """
     lazy_neighbor_list: List["Peer"] = []
 
-    for neighboring_peer in list(peer.peer_neighbor_mapping):
-        neighbor: "Neighbor" = peer.peer_neighbor_mapping[neighboring_peer]
+    # Neighbors are not deleted here but collected and returned, and the caller deletes them after
+    # this loop is done. So it is safe to iterate over the mapping directly without copying it.
+    for neighboring_peer, neighbor in peer.peer_neighbor_mapping.items():
         # update laziness
-        if neighbor.share_contribution[-1] <= lazy_contribution:
+        if neighbor.current_contribution <= lazy_contribution:
             neighbor.lazy_round += 1
         else:
             neighbor.lazy_round = 0
@@ -183,28 +214,47 @@ def tit_for_tat(
     """
 
     selected_peer_set: Set["Peer"] = set()
+    # the neighbor mapping is used in every branch below, so it is bound to a local name once.
+    neighbor_mapping: Dict["Peer", "Neighbor"] = peer.peer_neighbor_mapping
+    num_neighbors: int = len(neighbor_mapping)
     if time_now - time_start <= baby_ending:
-        selected_peer_set |= set(
-            random.sample(
-                list(peer.peer_neighbor_mapping),
-                min(len(peer.peer_neighbor_mapping), mutual + optimistic),
+        if mutual + optimistic >= num_neighbors:
+            # every neighbor will be selected, no need to sample.
+            selected_peer_set.update(neighbor_mapping)
+        else:
+            selected_peer_set.update(
+                random.sample(list(neighbor_mapping), mutual + optimistic)
             )
+    elif optimistic >= num_neighbors:
+        # This is an old peer, but all neighbors that are not highly ranked will be randomly
+        # selected anyway, so every neighbor is selected and there is no need to rank them.
+        selected_peer_set.update(neighbor_mapping)
+    elif optimistic == 0:
+        # This is an old peer and only highly ranked neighbors are selected. We only need the
+        # top "mutual" neighbors, so we use a heap instead of ranking all of them.
+        # heapq.nlargest() returns the same result as sorting and slicing, including the order of
+        # neighbors with equal scores.
+        top_neighbors: List[Tuple["Peer", "Neighbor"]] = heapq.nlargest(
+            mutual, neighbor_mapping.items(), key=lambda item: item[1].score
         )
+        # same as below, neighbors with zero score are not considered highly ranked.
+        while top_neighbors and top_neighbors[-1][1].score == 0:
+            top_neighbors.pop()
+        selected_peer_set.update(item[0] for item in top_neighbors)
     else:  # This is an old peer
         # ranked_list_of_peers is a list of peer instances who are my neighbors
         # and they are ranked according to their scores that I calculate.
         ranked_list_of_peers: List["Peer"] = peer.rank_neighbors()
         mutual = min(mutual, len(ranked_list_of_peers))
         while (
-            mutual > 0
-            and peer.peer_neighbor_mapping[ranked_list_of_peers[mutual - 1]].score == 0
+            mutual > 0 and neighbor_mapping[ranked_list_of_peers[mutual - 1]].score == 0
         ):
             mutual -= 1
 
         highly_ranked_peers_list: List["Peer"] = ranked_list_of_peers[:mutual]
         lowly_ranked_peers_list: List["Peer"] = ranked_list_of_peers[mutual:]
-        selected_peer_set |= set(highly_ranked_peers_list)
-        selected_peer_set |= set(
+        selected_peer_set.update(highly_ranked_peers_list)
+        selected_peer_set.update(
             random.sample(
                 lowly_ranked_peers_list, min(len(lowly_ranked_peers_list), optimistic)
             )
@@ -229,7 +279,10 @@ def random_recommendation(
     if not base or not target_number:
         raise ValueError("Base set is empty or target number is zero.")
     # if the target number is larger than the set size, output the whole set.
-    return set(random.sample(base, min(target_number, len(base))))
+    if target_number >= len(base):
+        return set(base)
+    # random.sample() does not accept a set from Python 3.11 on, so convert it to a list first.
+    return set(random.sample(list(base), target_number))
 
 
 def after_previous(peer: "Peer", time_now: int, init_birth_span: int) -> bool:
@@ -24,6 +24,27 @@ class Order:
     Order class, each instance being an order in the mesh system.
     """
 
+    # There can be a huge number of orders in a simulation, so we use __slots__ to save memory and
+    # speed up attribute access. Remember to add any new attribute here.
+    __slots__ = (
+        "scenario",
+        "seq",
+        "birth_time",
+        "creator",
+        "category",
+        "order_type",
+        "expiration",
+        "settlement",
+        "cancellation",
+        "holders",
+        "hesitators",
+        "is_expired",
+        "is_settled",
+        "is_canceled",
+        "is_missing",
+        "is_valid",
+    )
+
     def __init__(
         self,
         scenario: "Scenario",
@@ -106,6 +127,17 @@ class OrderInfo:
     Such information is not included in Order.
     """
 
+    # There are even more orderinfo instances than orders (one for every copy of an order that a
+    # peer receives), so we use __slots__ here as well. Remember to add any new attribute here.
+    __slots__ = (
+        "engine",
+        "arrival_time",
+        "prev_owner",
+        "novelty",
+        "priority",
+        "storage_decision",
+    )
+
     def __init__(
         self,
         engine: "Engine",
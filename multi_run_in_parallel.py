@@ -5,6 +5,7 @@ This module contains class MultiRunInParallel only.
 from multiprocessing import Pool
 from typing import List, Tuple, TYPE_CHECKING
 
+import numpy
 from single_run import SingleRun
 from data_types import SingleRunPerformanceResult, MultiRunPerformanceResult
 
@@ -24,6 +25,12 @@ class MultiRunInParallel:
     execution time.
     """
 
+    # The (scenario, engine, performance) tuple used by single_run_helper() in a worker process.
+    # It is set once per worker by init_worker(), so that these parameters are pickled once for
+    # every worker process, rather than once for every run. It is only declared here, so it does
+    # not exist until init_worker() is called.
+    worker_parameters: Tuple["Scenario", "Engine", "Performance"]
+
     def __init__(
         self,
         scenario: "Scenario",
@@ -38,16 +45,32 @@ class MultiRunInParallel:
         self.rounds: int = rounds  # how many times the simulator is run. Typically 40.
 
     @staticmethod
-    def single_run_helper(
-        args: Tuple["Scenario", "Engine", "Performance"]
-    ) -> SingleRunPerformanceResult:
+    def init_worker(
+        scenario: "Scenario", engine: "Engine", performance: "Performance"
+    ) -> None:
         """
-        This is a helper method called by method parallel_run(), to realize multi-processing.
-        It actually runs the single_run_execution() function in SingleRun.
-        :param args: arbitrary inputs.
+        This is the initializer of each worker process in multi_run_execution(). It keeps the
+        parameters of the simulator in the worker, for single_run_helper() to use.
+        :param scenario: scenario of the runs.
+        :param engine: engine of the runs.
+        :param performance: performance evaluation method of the runs.
+        :return: None
+        """
+        MultiRunInParallel.worker_parameters = (scenario, engine, performance)
+
+    @staticmethod
+    def single_run_helper(seed: int) -> SingleRunPerformanceResult:
+        """
+        This is a helper method called by method multi_run_execution(), to realize
+        multi-processing. It actually runs the single_run_execution() function in SingleRun,
+        using the parameters set by init_worker() in this worker process.
+        :param seed: random seed of this run.
         :return: SingleRun.run()
         """
-        return SingleRun(*args).single_run_execution()
+        if not hasattr(MultiRunInParallel, "worker_parameters"):
+            raise RuntimeError("Worker process is not initialized.")
+        scenario, engine, performance = MultiRunInParallel.worker_parameters
+        return SingleRun(scenario, engine, performance, seed).single_run_execution()
 
     @staticmethod
     def reorganize_performance_results(
@@ -89,14 +112,25 @@ class MultiRunInParallel:
 
         # Note: this method is simple so we don't have a unit test for it.
 
-        # Run multiple times in parallel
-        with Pool() as my_pool:
-            performance_result_list: List[SingleRunPerformanceResult] = my_pool.map(
-                self.single_run_helper,
-                [
-                    (self.scenario, self.engine, self.performance)
-                    for _ in range(self.rounds)
-                ],
+        # Generate an independent random seed for each run. Worker processes inherit the random
+        # state of this process, so each run needs to be seeded differently. SeedSequence makes
+        # sure that the seeds are well spread even though they come from the same entropy.
+        seeds: List[int] = [
+            int(seed)
+            for seed in numpy.random.SeedSequence().generate_state(self.rounds)
+        ]
+
+        # Run multiple times in parallel. Scenario, engine and performance are passed to each
+        # worker process once by the initializer, and each run only receives its seed.
+        # Runs can take quite different time, so they are handed out one at a time and collected
+        # in the order they finish. The order of the results does not matter since they are only
+        # aggregated over all runs.
+        with Pool(
+            initializer=self.init_worker,
+            initargs=(self.scenario, self.engine, self.performance),
+        ) as my_pool:
+            performance_result_list: List[SingleRunPerformanceResult] = list(
+                my_pool.imap_unordered(self.single_run_helper, seeds, chunksize=1)
             )
 
         return self.reorganize_performance_results(performance_result_list)
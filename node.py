@@ -3,9 +3,9 @@ This module contains Neighbor and Peer classes. They are both representatives of
 Note that sometimes we use "node" and "peer" interchangeably in the comment.
 """
 
-import collections
+import array
 import copy
-from typing import Deque, Set, Dict, List, Tuple, TYPE_CHECKING
+from typing import Set, Dict, List, Tuple, Iterable, Optional, TYPE_CHECKING, cast
 from message import OrderInfo, Order
 from data_types import PeerTypeName, Preference, NameSpacing, Priority
 
@@ -21,6 +21,19 @@ class Neighbor:
     refer to the mapping table in the SingleRun instance and find the corresponding Peer instance.
     """
 
+    # There is a neighbor instance for every link in the mesh, so we use __slots__ to save memory
+    # and speed up attribute access. Remember to add any new attribute here.
+    __slots__ = (
+        "engine",
+        "est_time",
+        "preference",
+        "current_contribution",
+        "share_contribution",
+        "head",
+        "score",
+        "lazy_round",
+    )
+
     def __init__(
         self,
         engine: "Engine",
@@ -45,11 +58,24 @@ class Neighbor:
         # If peer A shares his info to peer B, we say peer A contributes to B.
         # Such contribution is recorded in peer B's local record, i.e.,
         # the neighbor instance for peer A in the local storage of peer B.
-        # Formally, "share_contribution" is a queue to record a length of "score_length"
-        # of contributions, each corresponding to the score in one of the previous batches.
-        self.share_contribution: Deque[float] = collections.deque()
-        for _ in range(engine.score_length):
-            self.share_contribution.append(0.0)
+        # Formally, the contribution is recorded for "score_length" batches, each corresponding to
+        # the score in one of the recent batches.
+        # "current_contribution" is the contribution in the current batch. It is a plain float
+        # since it is updated every time my neighbor shares an order with me.
+        # "share_contribution" records the contributions in the previous (score_length - 1)
+        # batches. It is a circular buffer: "head" is the index of the entry for the latest
+        # completed batch, and the entry right after it (in a circular sense) is the oldest one.
+        # At the end of a batch, the engine moves "head" one step forward, overwrites the oldest
+        # entry with current_contribution, and resets current_contribution to zero, instead of
+        # popping and appending elements. It starts from the last index so that a freshly created
+        # record reads in the same order as a plain list, from the oldest to the latest batch.
+        # The record is an array of C doubles rather than a list of float objects, since there is
+        # one such record for every link in the mesh.
+        self.current_contribution: float = 0.0
+        self.share_contribution: "array.array[float]" = array.array(
+            "d", [0.0] * (engine.score_length - 1)
+        )
+        self.head: int = max(engine.score_length - 2, 0)
 
         self.score: float = 0.0  # the score to evaluate my neighbor.
 
@@ -69,6 +95,26 @@ class Peer:
     The Peer class is the main representation of a node in the Mesh.
     """
 
+    # Same as Neighbor, we use __slots__ for memory and attribute access speed.
+    # Remember to add any new attribute here.
+    __slots__ = (
+        "local_clock",
+        "engine",
+        "seq",
+        "birth_time",
+        "init_orderbook_size",
+        "namespacing",
+        "peer_type",
+        "is_free_rider",
+        "order_orderinfo_mapping",
+        "peer_neighbor_mapping",
+        "new_order_set",
+        "old_order_set",
+        "order_pending_orderinfo_mapping",
+        "verification_time_orders_mapping",
+        "previous_loop_starting_time",
+    )
+
     def __init__(
         self,
         engine: "Engine",
@@ -106,6 +152,11 @@ class Peer:
         self.peer_neighbor_mapping: Dict["Peer", Neighbor] = {}
         # set of newly and formally-stored orders that have NEVER been shared out by this peer.
         self.new_order_set: Set[Order] = set()
+        # set of formally-stored orders that have been shared out by this peer at least once.
+        # It is maintained incrementally so that new_order_set and old_order_set always
+        # partition the keys of order_orderinfo_mapping, and the engine does not need to
+        # recompute the difference in every batch.
+        self.old_order_set: Set[Order] = set()
 
         # The following mapping maintains a table of pending orders, by recording their orderinfo
         # instance. Note that an order can have multiple orderinfo instances, because it can be
@@ -263,18 +314,30 @@ class Peer:
         # if remove_order is True, delete all orders whose previous owner is this neighbor
 
         if remove_order:
-            for order in list(self.order_orderinfo_mapping):
-                orderinfo = self.order_orderinfo_mapping[order]
-                if orderinfo.prev_owner == peer:
-                    order.holders.remove(self)
-                    self.new_order_set.discard(order)
-                    del self.order_orderinfo_mapping[order]
-
-            for order in list(self.order_pending_orderinfo_mapping):
-                orderinfo_list = self.order_pending_orderinfo_mapping[order]
-                for idx, orderinfo in enumerate(orderinfo_list):
-                    if orderinfo.prev_owner == peer:
-                        del orderinfo_list[idx]
+            # First collect the orders to delete and then delete them, since a dictionary cannot
+            # be changed while it is being iterated over.
+            orders_to_delete: List[Order] = [
+                order
+                for order, orderinfo in self.order_orderinfo_mapping.items()
+                if orderinfo.prev_owner == peer
+            ]
+            for order in orders_to_delete:
+                order.holders.remove(self)
+                self.new_order_set.discard(order)
+                self.old_order_set.discard(order)
+                del self.order_orderinfo_mapping[order]
+
+            for order, orderinfo_list in list(
+                self.order_pending_orderinfo_mapping.items()
+            ):
+                # Rebuild the list without the orderinfo instances from this neighbor. Deleting
+                # elements while enumerating the list would skip the element right after each
+                # deleted one. The list is changed in place, so the mapping still refers to it.
+                orderinfo_list[:] = [
+                    orderinfo
+                    for orderinfo in orderinfo_list
+                    if orderinfo.prev_owner != peer
+                ]
                 if (
                     not orderinfo_list
                 ):  # no pending orderinfo. need to delete this entry
@@ -319,15 +382,34 @@ class Peer:
         self, peer: "Peer", order: Order, novelty_update: bool = False
     ) -> None:
         """
-        The method is called by method share_order() in class SingleRun.
-        It will immediately decide whether to put the order from the peer (who is my neighbor)
-        into my pending table.
+        This method is for receiving a single order from a neighbor. It is the same as
+        receive_orders_internal() (see below) with only one order.
         :param peer: the peer instance of the node who sends the order
         :param order: the order instance.
         :param novelty_update: an binary option. if True, the value of OrderInfo
         instance will increase by one once transmitted.
         :return: None
         """
+        self.receive_orders_internal(peer, (order,), novelty_update)
+
+    def receive_orders_internal(
+        self, peer: "Peer", orders: Iterable[Order], novelty_update: bool = False
+    ) -> None:
+        """
+        The method is called by method operations_in_a_time_round() in class SingleRun.
+        It will immediately decide whether to put each of the orders from the peer (who is my
+        neighbor) into my pending table.
+        All orders from the same neighbor are processed in one call, so that checking the
+        neighborhood and looking up the neighbor instance are done only once for the whole batch.
+        :param peer: the peer instance of the node who sends the orders
+        :param orders: the order instances.
+        :param novelty_update: an binary option. if True, the value of OrderInfo
+        instance will increase by one once transmitted.
+        :return: None
+        """
+
+        # pylint: disable=too-many-locals
+        # The extra locals are the attributes looked up once before the loop over the orders.
 
         if (
             self not in peer.peer_neighbor_mapping
@@ -337,65 +419,94 @@ class Peer:
 
         neighbor: Neighbor = self.peer_neighbor_mapping[peer]
 
-        if not self.engine.should_accept_internal_order(self, peer, order):
-            # update the contribution of my neighbor for his sharing
-            neighbor.share_contribution[-1] += self.engine.penalty_a
-            return
-
-        if order in self.order_orderinfo_mapping:  # no need to store again
-            orderinfo: OrderInfo = self.order_orderinfo_mapping[order]
-            if orderinfo.prev_owner == peer:
-                # I have this order in my local storage. My neighbor is sending me the same order
-                # again. It may be due to randomness of sharing old orders.
-                neighbor.share_contribution[-1] += self.engine.reward_a
+        # This loop runs for every order shared between every pair of neighbors, so we look up
+        # the frequently used attributes once, before the loop. The rewards and penalties for my
+        # neighbor are accumulated in a local variable and added to its current_contribution
+        # once, after the loop.
+        engine: "Engine" = self.engine
+        should_accept_internal_order = engine.should_accept_internal_order
+        penalty_a: float = engine.penalty_a
+        penalty_b: float = engine.penalty_b
+        reward_a: float = engine.reward_a
+        reward_b: float = engine.reward_b
+        order_orderinfo_mapping: Dict[Order, OrderInfo] = self.order_orderinfo_mapping
+        sender_orderinfo_mapping: Dict[Order, OrderInfo] = peer.order_orderinfo_mapping
+        pending_mapping: Dict[
+            Order, List[OrderInfo]
+        ] = self.order_pending_orderinfo_mapping
+        unverified_orders: List[Order] = self.verification_time_orders_mapping[0]
+        contribution: float = 0.0
+
+        for order in orders:
+
+            if not should_accept_internal_order(self, peer, order):
+                # update the contribution of my neighbor for his sharing
+                contribution += penalty_a
+                continue
+
+            orderinfo: Optional[OrderInfo] = order_orderinfo_mapping.get(order)
+            if orderinfo is not None:  # no need to store again
+                if orderinfo.prev_owner == peer:
+                    # I have this order in my local storage. My neighbor is sending me the same
+                    # order again. It may be due to randomness of sharing old orders.
+                    contribution += reward_a
+                else:
+                    # I have this order in my local storage, but it was from someone else.
+                    # No need to store it anymore. Just update the reward for the uploader.
+                    contribution += reward_b
+                continue
+
+            # If this order has not been formally stored: Need to write it into the pending
+            # table (even if there has been one with the same sequence number).
+
+            if novelty_update:
+                order_novelty = sender_orderinfo_mapping[order].novelty + 1
             else:
-                # I have this order in my local storage, but it was from someone else.
-                # No need to store it anymore. Just update the reward for the uploader.
-                neighbor.share_contribution[-1] += self.engine.reward_b
-            return
+                order_novelty = sender_orderinfo_mapping[order].novelty
 
-        # If this order has not been formally stored: Need to write it into the pending table (
-        # even if there has been one with the same sequence number).
+            # create an orderinfo instance
+            new_orderinfo: OrderInfo = OrderInfo(
+                engine=engine,
+                order=order,
+                master=self,
+                arrival_time=self.local_clock,
+                priority=None,
+                prev_owner=peer,
+                novelty=order_novelty,
+            )
 
-        if novelty_update:
-            order_novelty = peer.order_orderinfo_mapping[order].novelty + 1
-        else:
-            order_novelty = peer.order_orderinfo_mapping[order].novelty
-
-        # create an orderinfo instance
-        new_orderinfo: OrderInfo = OrderInfo(
-            engine=self.engine,
-            order=order,
-            master=self,
-            arrival_time=self.local_clock,
-            priority=None,
-            prev_owner=peer,
-            novelty=order_novelty,
-        )
+            pending_orderinfo_list: Optional[List[OrderInfo]] = pending_mapping.get(
+                order
+            )
 
-        # If no such order in the pending list, create an entry for it
-        if order not in self.order_pending_orderinfo_mapping:
-            # order not in the pending set
-            self.order_pending_orderinfo_mapping[order] = [new_orderinfo]
-            self.verification_time_orders_mapping[0].append(order)
-            order.hesitators.add(self)
-            # Put into the pending table. Reward will be updated when storing decision is made.
-            return
+            # If no such order in the pending list, create an entry for it
+            if pending_orderinfo_list is None:
+                # order not in the pending set
+                pending_mapping[order] = [new_orderinfo]
+                unverified_orders.append(order)
+                order.hesitators.add(self)
+                # Put into the pending table. Reward will be updated when storing decision is
+                # made.
+                continue
+
+            # If there is such an order in the pending list, check if it is from the same
+            # prev_owner.
+            for existing_orderinfo in pending_orderinfo_list:
+                if peer == existing_orderinfo.prev_owner:
+                    # This neighbor is sending duplicates to me in a short period of time. Likely
+                    # to be a malicious one.
+                    # Penalty is imposed to this neighbor. But please be noted that this peer's
+                    # previous copy is still in the pending list, and if it is finally stored,
+                    # this peer will still get a reward for the order being stored.
+                    contribution += penalty_b
+                    break
+            else:
+                # My neighbor is honest, but he is late in sending me the message.
+                # Add it to the pending list anyway since later, his version of the order might
+                # be selected.
+                pending_orderinfo_list.append(new_orderinfo)
 
-        # If there is such an order in the pending list, check if it is from the same prev_owner.
-        for existing_orderinfo in self.order_pending_orderinfo_mapping[order]:
-            if peer == existing_orderinfo.prev_owner:
-                # This neighbor is sending duplicates to me in a short period of time. Likely to
-                # be a malicious one.
-                # Penalty is imposed to this neighbor. But please be noted that this peer's
-                # previous copy is still in the pending list, and if it is finally stored,
-                # this peer will still get a reward for the order being stored.
-                neighbor.share_contribution[-1] += self.engine.penalty_b
-                return
-
-        # My neighbor is honest, but he is late in sending me the message.
-        # Add it to the pending list anyway since later, his version of the order might be selected.
-        self.order_pending_orderinfo_mapping[order].append(new_orderinfo)
+        neighbor.current_contribution += contribution
 
     def store_orders(self) -> None:
         """
@@ -404,75 +515,106 @@ class Peer:
         :return: None
         """
 
+        # pylint: disable=too-many-branches
+        # The branches follow the cases of the reward rules, which are easier to check against
+        # each other when they are kept together in this method.
+
         if self.local_clock not in self.verification_time_orders_mapping:
             raise RuntimeError(
                 "Store order decision should not be called at this time."
             )
 
+        # If no order completes its verification now, there is nothing to decide on. This happens
+        # e.g. when the peer had no new order to verify at the beginning of this batch.
+        if not self.verification_time_orders_mapping[self.local_clock]:
+            return
+
         # change orderinfo.storage_decision to True if you would like to store this order.
         self.engine.store_or_discard_orders(self)
 
         # Now store an orderinfo if necessary
 
-        for order in list(self.order_pending_orderinfo_mapping):
-
-            if order in self.verification_time_orders_mapping[self.local_clock]:
-
-                orderinfo_list = self.order_pending_orderinfo_mapping[order]
-
-                # Sort the list of pending orderinfo with the same order instance, so that if
-                # there is some order to be stored, it will be the first one.
-                orderinfo_list.sort(
-                    key=lambda item: item.storage_decision, reverse=True
-                )
-
-                # Update the order instance, e.g., number of pending orders, and remove the
-                # hesitator, in advance.
-                order.hesitators.remove(self)
+        # We look up the neighbor instance of the sender of each orderinfo by dict.get(), which
+        # does one lookup only, rather than checking membership first and then looking it up.
+        # The sender (prev_owner) is None for an external order, and get() returns None for it
+        # as well, since None is never a key of peer_neighbor_mapping. The cast is only to tell
+        # mypy that it is fine to look up a None key.
+        neighbor_mapping = cast(
+            Dict[Optional["Peer"], Neighbor], self.peer_neighbor_mapping
+        )
 
-                # After sorting, for all pending orderinfo with the same order instance,
-                # either (1) no one is to be stored, or (2) only the first one is stored
+        # The rewards are read once here instead of once per orderinfo.
+        reward_c: float = self.engine.reward_c
+        reward_d: float = self.engine.reward_d
+        reward_e: float = self.engine.reward_e
+        pending_mapping = self.order_pending_orderinfo_mapping
+
+        # Go through the orders whose verification completes now, rather than going through the
+        # whole pending table and checking every order against this list.
+
+        for order in self.verification_time_orders_mapping[self.local_clock]:
+
+            # Take the entry out of the pending mapping table right away; it is deleted from the
+            # table after the decision anyway.
+            # The order might have left the pending table already, e.g., it was deleted since it
+            # became invalid, or it has been processed since it appears in this list twice.
+            orderinfo_list = pending_mapping.pop(order, None)
+            if orderinfo_list is None:
+                continue
+
+            # Find the pending orderinfo to be stored, if any. There should be at most one. We
+            # stop at the first one, which is usually the first one in the list already, and
+            # check the rest below, so there is no need to sort or re-arrange the list.
+            stored_orderinfo: Optional[OrderInfo] = None
+            for pending_orderinfo in orderinfo_list:
+                if pending_orderinfo.storage_decision:
+                    stored_orderinfo = pending_orderinfo
+                    break
+
+            # Update the order instance, e.g., number of pending orders, and remove the
+            # hesitator, in advance.
+            order.hesitators.remove(self)
 
-                if not orderinfo_list[0].storage_decision:  # if nothing is to be stored
-                    for pending_orderinfo in orderinfo_list:
-                        # Find the global instance of the sender, and update it.
-                        # If it is an internal order and sender is still a neighbor
-                        if pending_orderinfo.prev_owner in self.peer_neighbor_mapping:
-                            self.peer_neighbor_mapping[
-                                pending_orderinfo.prev_owner
-                            ].share_contribution[-1] += self.engine.reward_c
+            # For all pending orderinfo with the same order instance, either (1) no one is to be
+            # stored, or (2) only stored_orderinfo is stored
 
-                else:  # the first element is to be stored
-                    first_pending_orderinfo: OrderInfo = orderinfo_list[0]
-                    # Find the global instance for the sender, and update it.
+            if stored_orderinfo is None:  # if nothing is to be stored
+                for pending_orderinfo in orderinfo_list:
+                    # Find the global instance of the sender, and update it.
                     # If it is an internal order and sender is still a neighbor
-                    if first_pending_orderinfo.prev_owner in self.peer_neighbor_mapping:
-                        self.peer_neighbor_mapping[
-                            first_pending_orderinfo.prev_owner
-                        ].share_contribution[-1] += self.engine.reward_d
-
-                    # Add the orderinfo instance into the local storage,
-                    # and update the order instance
-                    self.order_orderinfo_mapping[order] = first_pending_orderinfo
-                    self.new_order_set.add(order)
-                    order.holders.add(self)
-
-                    # For the remaining pending orderinfo in the list, no need to store them,
-                    # but may need updates.
-                    for pending_orderinfo in orderinfo_list[1:]:
-                        if pending_orderinfo.storage_decision:
-                            raise ValueError(
-                                "Should not store multiple copies of same orders."
-                            )
-                        # internal order, sender is still neighbor
-                        if pending_orderinfo.prev_owner in self.peer_neighbor_mapping:
-                            # update the share contribution
-                            self.peer_neighbor_mapping[
-                                pending_orderinfo.prev_owner
-                            ].share_contribution[-1] += self.engine.reward_e
-
-                # delete this entry from the pending mapping table
-                del self.order_pending_orderinfo_mapping[order]
+                    sender: Optional[Neighbor] = neighbor_mapping.get(
+                        pending_orderinfo.prev_owner
+                    )
+                    if sender is not None:
+                        sender.current_contribution += reward_c
+
+            else:  # stored_orderinfo is to be stored
+                # Find the global instance for the sender, and update it.
+                # If it is an internal order and sender is still a neighbor
+                sender = neighbor_mapping.get(stored_orderinfo.prev_owner)
+                if sender is not None:
+                    sender.current_contribution += reward_d
+
+                # Add the orderinfo instance into the local storage,
+                # and update the order instance
+                self.order_orderinfo_mapping[order] = stored_orderinfo
+                self.new_order_set.add(order)
+                order.holders.add(self)
+
+                # For the remaining pending orderinfo in the list, no need to store them,
+                # but may need updates.
+                for pending_orderinfo in orderinfo_list:
+                    if pending_orderinfo is stored_orderinfo:
+                        continue
+                    if pending_orderinfo.storage_decision:
+                        raise ValueError(
+                            "Should not store multiple copies of same orders."
+                        )
+                    # internal order, sender is still neighbor
+                    sender = neighbor_mapping.get(pending_orderinfo.prev_owner)
+                    if sender is not None:
+                        # update the share contribution
+                        sender.current_contribution += reward_e
 
     def share_orders(self, birth_time_span) -> Tuple[Set[Order], Set["Peer"]]:
         """
@@ -490,6 +632,7 @@ class Peer:
 
         # free riders do not share any order.
         if self.is_free_rider:
+            self.old_order_set |= self.new_order_set
             self.new_order_set.clear()
             return set(), set()
 
@@ -498,7 +641,8 @@ class Peer:
         # orders to share
         order_to_share_set: Set[Order] = self.engine.find_orders_to_share(self)
 
-        # clear self.new_order_set for future use
+        # all new orders become old ones. Clear self.new_order_set for future use
+        self.old_order_set |= self.new_order_set
         self.new_order_set.clear()
 
         # peers to share
@@ -521,6 +665,7 @@ class Peer:
         # check if this order is in the local storage
         if order in self.order_orderinfo_mapping:
             self.new_order_set.discard(order)
+            self.old_order_set.discard(order)
             del self.order_orderinfo_mapping[order]
             order.holders.remove(self)
 
@@ -546,8 +691,12 @@ class Peer:
         :return: a list peer instances ranked by the scores of their corresponding neighbor
         instances, from top to down.
         """
-        peer_list: List["Peer"] = list(self.peer_neighbor_mapping)
-        peer_list.sort(
-            key=lambda item: self.peer_neighbor_mapping[item].score, reverse=True
+        # sort() calls the key function once per neighbor, not once per comparison, so the cost
+        # of the key is linear anyway. Sorting the (peer, neighbor) pairs saves the dictionary
+        # lookup in it, though.
+        ranked_items: List[Tuple["Peer", Neighbor]] = sorted(
+            self.peer_neighbor_mapping.items(),
+            key=lambda item: item[1].score,
+            reverse=True,
         )
-        return peer_list
+        return [peer for peer, _ in ranked_items]
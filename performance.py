@@ -151,10 +151,25 @@ class Performance:
                 f"{self.satisfaction_option['method']}"
             )
 
-        set_of_adult_peers_to_evaluate: Set["Peer"] = set(
+        # The adult peers are only iterated over once below, so a list is enough; there is no
+        # need to hash every peer into a new set.
+        adult_peers_to_evaluate: List["Peer"] = [
             peer
             for peer in peers_to_evaluate
             if cur_time - peer.birth_time >= self.adult_age
+        ]
+
+        # There is nothing to calculate if no peer is old enough to be evaluated.
+        if not adult_peers_to_evaluate:
+            return []
+
+        # The number of orders in each statistical window is the same for every peer, so we
+        # count it once here rather than once for each peer.
+        order_stat_on_age: List[int] = performance_candidates.order_num_stat_on_age(
+            cur_time,
+            self.max_age_to_track,
+            self.statistical_window,
+            orders_to_evaluate,
         )
 
         satisfaction_list: List[float] = [
@@ -164,8 +179,9 @@ class Performance:
                 self.max_age_to_track,
                 self.statistical_window,
                 orders_to_evaluate,
+                order_stat_on_age,
             )
-            for peer in set_of_adult_peers_to_evaluate
+            for peer in adult_peers_to_evaluate
         ]
 
         return satisfaction_list
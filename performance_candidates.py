@@ -5,7 +5,6 @@ This module contains possible implementations for performance measurement functi
 # NOTE: the attribute "max_age_to_track" in all functions means that orders whose age is less
 # than this value will be considered; orders whose age is exactly this value will be excluded.
 
-import statistics
 from typing import TYPE_CHECKING, Set, List, Optional
 from data_types import SpreadingRatio
 
@@ -42,29 +41,31 @@ def order_spreading_ratio_stat(
     """
 
     num_active_peers: int = len(peer_set)
-    order_spreading_record: List[List[float]] = [
-        [] for _ in range(int((max_age_to_track - 1) / statistical_window) + 1)
-    ]
+    num_windows: int = int((max_age_to_track - 1) / statistical_window) + 1
+
+    # For each window, we accumulate the total number of holders (within peer_set) of the orders,
+    # and the number of orders. The average spreading ratio of a window is then
+    # total holders / (number of orders * number of peers), without storing the ratio of
+    # every single order.
+    num_holders_in_window: List[int] = [0] * num_windows
+    num_orders_in_window: List[int] = [0] * num_windows
 
     for order in order_set:
-        num_peers_holding_order: int = len(
-            list(item for item in order.holders if item in peer_set)
-        )
-        ratio: float = num_peers_holding_order / num_active_peers
         age: int = cur_time - order.birth_time
         if age < 0:
             raise ValueError("Order age should not be negative.")
         if age < max_age_to_track:
-            order_spreading_record[int(age / statistical_window)].append(ratio)
+            # age is a non-negative integer, so integer floor division gives the same window as
+            # int(age / statistical_window) without going through a float.
+            window: int = age // statistical_window
+            # set intersection runs in C and iterates over the smaller set.
+            num_holders_in_window[window] += len(order.holders.intersection(peer_set))
+            num_orders_in_window[window] += 1
 
     order_spreading_ratio: SpreadingRatio = [
-        0.0 for _ in range(len(order_spreading_record))
+        num_holders / (num_orders * num_active_peers) if num_orders else None
+        for num_holders, num_orders in zip(num_holders_in_window, num_orders_in_window)
     ]
-    for idx, sublist in enumerate(order_spreading_record):
-        if sublist:
-            order_spreading_ratio[idx] = statistics.mean(sublist)
-        else:
-            order_spreading_ratio[idx] = None
     return order_spreading_ratio
 
 
@@ -92,7 +93,7 @@ def order_num_stat_on_age(
         if age < 0:
             raise ValueError("Some order age is negative.")
         if age < max_age_to_track:
-            bin_idx: int = int(age / statistical_window)
+            bin_idx: int = age // statistical_window
             num_orders_in_age_range[bin_idx] += 1
     return num_orders_in_age_range
 
@@ -125,7 +126,7 @@ def peer_order_stat_on_window(
         if age < 0:
             raise ValueError("Order age should not be negative.")
         if age < max_age_to_track and order in order_set:
-            bin_index: int = int(age / statistical_window)
+            bin_index: int = age // statistical_window
             num_orders_this_peer_stores[bin_index] += 1
 
     return num_orders_this_peer_stores
@@ -137,6 +138,7 @@ def single_peer_order_receipt_ratio(
     max_age_to_track: int,
     statistical_window: int,
     order_set: Set["Order"],
+    order_stat_based_on_age: Optional[List[int]] = None,
 ) -> SpreadingRatio:
     """
     This is a helper function. It calculates the ratios of orders that a peer receives, over the
@@ -147,24 +149,28 @@ def single_peer_order_receipt_ratio(
     :param max_age_to_track: same as above function.
     :param statistical_window: same as above function.
     :param order_set: same as above function.
+    :param order_stat_based_on_age: optional, the result of order_num_stat_on_age() for the
+    above arguments. It is the same for all peers, so when evaluating many peers, the caller can
+    calculate it once and pass it in. If not given, it is calculated here.
     :return: a list, each element being the ratio of orders that this peer receives over all
     orders in order_set, for this statistical window. If there's no order in that range,
     the value is set as None.
     """
 
+    # An empty window is common, so we check the denominator rather than catching the
+    # ZeroDivisionError, which is much more expensive to raise and handle.
     def try_division(numerator: int, denominator: int) -> Optional[float]:
-        try:
-            result: float = numerator / denominator
-            return result
-        except ZeroDivisionError:
+        if denominator == 0:
             return None
-
-    order_stat_based_on_age: List[int] = order_num_stat_on_age(
-        cur_time=cur_time,
-        max_age_to_track=max_age_to_track,
-        statistical_window=statistical_window,
-        order_set=order_set,
-    )
+        return numerator / denominator
+
+    if order_stat_based_on_age is None:
+        order_stat_based_on_age = order_num_stat_on_age(
+            cur_time=cur_time,
+            max_age_to_track=max_age_to_track,
+            statistical_window=statistical_window,
+            order_set=order_set,
+        )
     num_orders_this_peer_stores: List[int] = peer_order_stat_on_window(
         peer=peer,
         cur_time=cur_time,
@@ -185,6 +191,7 @@ def single_peer_satisfaction_neutral(
     max_age_to_track: int,
     statistical_window: int,
     order_set: Set["Order"],
+    order_stat_based_on_age: Optional[List[int]] = None,
 ) -> float:
     """
     This function calculates a peer's satisfaction based on his observation ratios.
@@ -195,6 +202,7 @@ def single_peer_satisfaction_neutral(
     :param max_age_to_track: same as above function.
     :param statistical_window: same as above function.
     :param order_set: same as above function.
+    :param order_stat_based_on_age: same as above function.
     :return: A single value for this peer's satisfaction, or None if it did not receive anything.
     """
     peer_observation_ratio: SpreadingRatio = single_peer_order_receipt_ratio(
@@ -203,18 +211,21 @@ def single_peer_satisfaction_neutral(
         max_age_to_track=max_age_to_track,
         statistical_window=statistical_window,
         order_set=order_set,
+        order_stat_based_on_age=order_stat_based_on_age,
     )
 
-    try:
-        return statistics.mean(
-            item for item in peer_observation_ratio if item is not None
-        )
-    except statistics.StatisticsError:
+    # A plain sum over count is used for the average. statistics.mean() computes it exactly,
+    # with fractions, which is much slower and not needed for ratios in [0, 1].
+    valid_ratios: List[float] = [
+        item for item in peer_observation_ratio if item is not None
+    ]
+    if not valid_ratios:
         # There is no order in the system. Normally the code should never reach here.
         raise RuntimeError(
             "Unable to judge a single peer satisfaction since there are no orders "
             "in the system for now."
         )
+    return sum(valid_ratios) / len(valid_ratios)
 
 
 def fairness_dummy(_peer_set: Set["Peer"], _order_set: Set["Order"]) -> float:
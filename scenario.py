@@ -99,7 +99,9 @@ class Scenario:
         if self.option_number_of_events["method"] == "Poisson":
             # check if "rate" is in the correct format
             if isinstance(rate, PoissonArrivalRate):
-                return list(numpy.random.poisson(rate, max_time))
+                # All counts are drawn in one vectorized call. tolist() converts them into
+                # Python ints at once, which are cheaper to use later than numpy integers.
+                return numpy.random.poisson(rate, max_time).tolist()
             raise TypeError(
                 "Type of the rate is incorrect. Float is expected, but it is: "
                 + str(type(rate))
@@ -53,36 +53,43 @@ def hawkes(rate: HawkesArrivalRate, max_time: int) -> List[int]:
     if not (lambda_0 >= a >= 0 and delta > 0 and gamma >= 0):
         raise ValueError("Parameter setting is incorrect for the Hawkes process.")
 
-    T: List[float] = [0.0]  # this is the list of event happening time.
+    # Rather than keeping the list of all event happening times, we keep the latest one only,
+    # and count an event into its time slot as soon as it is generated. The last generated time
+    # point is beyond max_time and is not counted, just as the original algorithm discards it.
+    # Functions called in every iteration are bound to local names first.
+    uniform = random.random
+    log = math.log
+    exp = math.exp
+
+    num_events: List[int] = [0] * max_time
+    T: float = 0.0  # the latest event happening time.
     lambda_plus = lambda_0
 
-    while T[-1] < max_time:
-        u0 = random.random()
+    while T < max_time:
+        u0 = uniform()
         try:
-            s0 = -1 / a * math.log(u0)
+            s0 = -1 / a * log(u0)
         except ZeroDivisionError:
             s0 = float("inf")
-        u1 = random.random()
+        u1 = uniform()
         try:
-            d = 1 + delta * math.log(u1) / (lambda_plus - a)
+            d = 1 + delta * log(u1) / (lambda_plus - a)
         except ZeroDivisionError:
             d = float("-inf")
         if d > 0:
             try:
-                s1 = (-1 / delta) * math.log(d)
+                s1 = (-1 / delta) * log(d)
             except ZeroDivisionError:
                 s1 = float("inf")
             tau = min(s0, s1)
         else:
             tau = s0
-        T.append(T[-1] + tau)
-        lambda_minus = (lambda_plus - a) * math.exp(-delta * tau) + a
+        T += tau
+        if T < max_time:
+            num_events[int(T)] += 1
+        lambda_minus = (lambda_plus - a) * exp(-delta * tau) + a
         lambda_plus = lambda_minus + gamma
 
-    num_events: List[int] = [0] * max_time
-    for t in T[1:-1]:
-        num_events[int(t)] += 1
-
     return num_events
 
 
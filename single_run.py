@@ -38,14 +38,31 @@ class SingleRun:
     """
 
     def __init__(
-        self, scenario: "Scenario", engine: "Engine", performance: "Performance"
+        self,
+        scenario: "Scenario",
+        engine: "Engine",
+        performance: "Performance",
+        seed: Optional[int] = None,
     ) -> None:
         """
         This init function sets up the attribute values for the class instance. It does not
         really create the initial order set or peer set; instead, the method followed
         (create_initial_peers_orders()) creates them.
+        If "seed" is given, it also seeds the random number generators (both random and
+        numpy.random) with it, and it must be an integer in [0, 2**32 - 1]. If "seed" is None,
+        the random number generators are left as they are, so any seeding done by the caller
+        before creating the instance still applies.
         """
 
+        # Seed the random number generators before anything random happens (e.g., the server
+        # response time below). This is very important for multiprocessing: worker processes are
+        # forked from the same parent and inherit its numpy.random state, so without reseeding,
+        # different runs would produce correlated (or even identical) random streams.
+        # MultiRunInParallel gives each run a different seed.
+        if seed is not None:
+            random.seed(seed)
+            numpy.random.seed(seed)
+
         # server_response_time refers to the random response time of the Ethereum hosting service
         # for on-chain check.
         # Theoretically, the response time for a batch of n orders verification is:
@@ -270,7 +287,12 @@ class SingleRun:
             order.hesitators.remove(peer)
 
         # update existing peers
-        for other_peer in self.peer_full_set:
+        # Neighborhood relationships are always established and cancelled in pairs, so the peers
+        # who have this peer as a neighbor are exactly the neighbors of this peer. There is no need
+        # to go through all peers in the system.
+        # A copy of the neighbors is needed since del_neighbor() notifies this peer to delete the
+        # other peer from its neighbors as well.
+        for other_peer in list(peer.peer_neighbor_mapping):
             if peer in other_peer.peer_neighbor_mapping:
                 other_peer.del_neighbor(peer)
 
@@ -333,26 +355,33 @@ class SingleRun:
         :return: None.
         """
 
-        for order in list(self.order_full_set):
-            if not order.is_valid:
-
-                # update invalid order statistics
-                if order.is_canceled:
-                    self.invalid_orders_stat["canceled_count"] += 1
-                elif order.is_settled:
-                    self.invalid_orders_stat["settled_count"] += 1
-                elif order.is_expired:
-                    self.invalid_orders_stat["expired_count"] += 1
-                else:
-                    self.invalid_orders_stat["missing_count"] += 1
-
-                # delete this order
-                for peer in list(order.holders):
-                    peer.del_order(order)
-                for peer in list(order.hesitators):
-                    peer.del_order(order)
-                self.order_full_set.remove(order)
-                self.order_type_set_mapping[order.order_type].remove(order)
+        # Most orders are still valid in any given round, so we first filter out the invalid ones
+        # in one pass (a single flag check per order), rather than copying the whole order set
+        # and testing every order in the loop body below. The filtered list also allows
+        # us to modify self.order_full_set while deleting.
+        invalid_orders: List[Order] = [
+            order for order in self.order_full_set if not order.is_valid
+        ]
+
+        for order in invalid_orders:
+
+            # update invalid order statistics
+            if order.is_canceled:
+                self.invalid_orders_stat["canceled_count"] += 1
+            elif order.is_settled:
+                self.invalid_orders_stat["settled_count"] += 1
+            elif order.is_expired:
+                self.invalid_orders_stat["expired_count"] += 1
+            else:
+                self.invalid_orders_stat["missing_count"] += 1
+
+            # delete this order
+            for peer in list(order.holders):
+                peer.del_order(order)
+            for peer in list(order.hesitators):
+                peer.del_order(order)
+            self.order_full_set.remove(order)
+            self.order_type_set_mapping[order.order_type].remove(order)
 
     def add_new_links_helper(self, requester: Peer, demand: int, minimum: int) -> None:
         """
@@ -425,9 +454,15 @@ class SingleRun:
 
         # Note: this method is simple so we don't have a unit test for it.
 
-        for peer_to_depart in random.sample(
-            self.peer_full_set, min(len(self.peer_full_set), peer_dept_num)
-        ):
+        # random.sample() only accepts sequences from Python 3.11 on, and for a set it used to
+        # build a tuple of the whole set internally anyway, so we take one snapshot of the peers
+        # here. The snapshot is also needed since peer_departure() changes self.peer_full_set.
+        peer_list: List[Peer] = list(self.peer_full_set)
+        if peer_dept_num >= len(peer_list):
+            peers_to_depart: List[Peer] = peer_list
+        else:
+            peers_to_depart = random.sample(peer_list, peer_dept_num)
+        for peer_to_depart in peers_to_depart:
             self.peer_departure(peer_to_depart)
 
     def group_of_peers_arrival_helper(self, peer_arr_num: int) -> None:
@@ -482,17 +517,24 @@ class SingleRun:
         # is proportional to the peer j's expected number of initial orders of type i.
         # Free riders will not be candidates since they don't have init orderbook.
 
+        # The candidate list below has an entry for every (peer, order type) pair, so we don't
+        # build it at all in rounds without order arrivals.
+        if order_arr_num == 0:
+            return
+
         candidate_peer_and_order_type_combination: List[
             Tuple[Peer, OrderTypeName]
         ] = list()
         candidate_weights: List[float] = list()
-        for peer in list(self.peer_full_set):
+        # The peer set is only read here, so there is no need to copy it into a list first.
+        for peer in self.peer_full_set:
             peer_property = self.scenario.peer_type_property[peer.peer_type]
-            for order_type in peer_property.initial_orderbook_size_dict.keys():
+            for (
+                order_type,
+                init_orderbook_size_distribution,
+            ) in peer_property.initial_orderbook_size_dict.items():
                 candidate_peer_and_order_type_combination.append((peer, order_type))
-                candidate_weights.append(
-                    peer_property.initial_orderbook_size_dict[order_type].mean
-                )
+                candidate_weights.append(init_orderbook_size_distribution.mean)
 
         target_peer_and_type_list: List[Tuple[Peer, OrderTypeName]] = random.choices(
             candidate_peer_and_order_type_combination,
@@ -579,9 +621,10 @@ class SingleRun:
                 (orders_to_share, neighbors_to_share) = peer.share_orders(
                     self.scenario.birth_time_span
                 )
-                for internal_order in orders_to_share:
+                # Each beneficiary receives all shared orders in one batch.
+                if orders_to_share:
                     for beneficiary_peer in neighbors_to_share:
-                        beneficiary_peer.receive_order_internal(peer, internal_order)
+                        beneficiary_peer.receive_orders_internal(peer, orders_to_share)
                 del peer.verification_time_orders_mapping[self.cur_time]
 
     def generate_events_during_whole_process(
@@ -597,8 +640,8 @@ class SingleRun:
         """
 
         # initiate vectors of each event happening count in each time round
-        # This is very important since numpy.random is not multiprocessing safe in Hawkes Process.
-        numpy.random.seed()
+        # Note: numpy.random has been seeded for this run in __init__(), so it is safe to use it
+        # here under multiprocessing.
         counts_growth: List[List[int]] = list(
             map(
                 lambda x: self.scenario.generate_event_counts_over_time(
@@ -607,7 +650,6 @@ class SingleRun:
                 self.scenario.growth_rates,
             )
         )
-        numpy.random.seed()
         counts_stable: List[List[int]] = list(
             map(
                 lambda x: self.scenario.generate_event_counts_over_time(
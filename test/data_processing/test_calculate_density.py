@@ -77,6 +77,15 @@ def test_calculate_density__out_of_range() -> None:
         calculate_density([SATISFACTORY_LIST[4]], 0.1)
 
 
+def test_calculate_density__negative_value() -> None:
+    """
+    This function tests calculate_density() with a negative number.
+    :return: None
+    """
+    with pytest.raises(ValueError, match="Some input data is out of range."):
+        calculate_density([[0.5, -0.5]], 0.1)
+
+
 def test_calculate_density__invalid_division_unit() -> None:
     """
     This function tests calculate_density() with invalid division unit.
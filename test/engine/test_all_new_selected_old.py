@@ -19,10 +19,11 @@ from ..__init__ import (
 
 # Cases for the test function.
 # Basic setting: We create a peer (with 5 initial orders) and a set of other orders (total number
-# is `total`). We manually clear the new_order_set for the peer, and add some orders into the
-# new_order_set (total number is `new`). We set the max_share and old_prob as defined by function
-# `all_new_selected_old()`. Expected_result is a tuple of three elements: total number of orders
-# selected; total number of new orders selected; and total number of old orders selected.
+# is `total`). We manually move all orders of the peer into the old_order_set, and move some
+# orders back into the new_order_set (total number is `new`). We set the max_share and old_prob
+# as defined by function `all_new_selected_old()`. Expected_result is a tuple of three elements:
+# total number of orders selected; total number of new orders selected; and total number of old
+# orders selected.
 #
 # There are three cases that we consider:
 # Case 1: The peer has a total of (12+5=17) orders, of which 8 are new. The maximal share number
@@ -35,6 +36,9 @@ from ..__init__ import (
 # Case 3: The peer has a total of (12+5=17) orders, of which 4 are new. The maximal share number
 # is 200, so all new orders (4) are selected; for the 13 old orders 13*0.5=6 are selected,
 # and the total number of orders selected is 10.
+#
+# Case 4: The peer has a total of (12+5=17) orders, of which 4 are new. The maximal share number
+# is 200 and old_prob = 1, so all orders (17) are selected.
 
 
 class CaseType(NamedTuple):
@@ -82,10 +86,20 @@ CASE_3 = CaseType(
     expected_result=(10, 4, 6),
 )
 
+CASE_4 = CaseType(
+    scenario=SCENARIO_SAMPLE,
+    engine=ENGINE_SAMPLE,
+    total=12,
+    new=4,
+    max_share=200,
+    old_prob=1,
+    expected_result=(17, 4, 13),
+)
+
 
 @pytest.mark.parametrize(
     "scenario,engine,total,new,max_share,old_prob,expected_results",
-    [CASE_1, CASE_2, CASE_3],
+    [CASE_1, CASE_2, CASE_3, CASE_4],
 )
 def test_all_new_selected_old(
     scenario: Scenario,
@@ -113,9 +127,11 @@ def test_all_new_selected_old(
 
     peer.store_orders()
 
-    # Manually set orders as new ones.
+    # Manually set orders as new ones, and the rest as old ones.
+    peer.old_order_set |= peer.new_order_set
     peer.new_order_set.clear()
     for order in order_list[:new]:
+        peer.old_order_set.remove(order)
         peer.new_order_set.add(order)
 
     # Act.
@@ -129,10 +145,4 @@ def test_all_new_selected_old(
     # Assert new orders selected.
     assert len(selected_order_set & peer.new_order_set) == expected_results[1]
     # Assert old orders selected
-    assert (
-        len(
-            selected_order_set
-            & (set(peer.order_orderinfo_mapping) - peer.new_order_set)
-        )
-        == expected_results[2]
-    )
+    assert len(selected_order_set & peer.old_order_set) == expected_results[2]
@@ -0,0 +1,40 @@
+"""
+This module contains unit tests of the contribution record update in find_neighbors_to_share().
+"""
+
+import array
+import pytest
+from scenario import Scenario
+from engine import Engine
+
+from ..__init__ import ENGINE_SAMPLE, SCENARIO_SAMPLE
+from .__init__ import create_a_peer_and_two_neighbors_helper
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_find_neighbors_to_share__contribution_record(
+    scenario: Scenario, engine: Engine
+):
+    """
+    This tests that at the end of a batch, the contribution of the current batch is moved into the
+    record of previous batches (replacing the oldest one), and the current contribution is reset.
+    """
+
+    # Arrange.
+
+    peer, _, neighbor_instance_list = create_a_peer_and_two_neighbors_helper(
+        scenario, engine
+    )
+
+    # previous batches are [1, 2] from the oldest to the latest, and the current one is 5.
+    neighbor_instance_list[0].share_contribution = array.array("d", [1, 2])
+    neighbor_instance_list[0].head = 1
+    neighbor_instance_list[0].current_contribution = 5
+
+    # Act.
+    engine.find_neighbors_to_share(time_now=100, peer=peer, time_start=0)
+
+    # Assert. Now previous batches are [2, 5] from the oldest to the latest.
+    assert neighbor_instance_list[0].head == 0
+    assert neighbor_instance_list[0].share_contribution == array.array("d", [5, 2])
+    assert neighbor_instance_list[0].current_contribution == 0
@@ -0,0 +1,61 @@
+"""
+This module contains unit tests of random_recommendation().
+"""
+
+from typing import List, Set
+import pytest
+
+from node import Peer
+from scenario import Scenario
+from engine import Engine
+
+import engine_candidates
+
+from ..__init__ import ENGINE_SAMPLE, SCENARIO_SAMPLE, create_test_peers
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_random_recommendation__normal(scenario: Scenario, engine: Engine) -> None:
+    """
+    Test when the target number is smaller than the base size.
+    """
+    # Arrange.
+    peer_list: List[Peer] = create_test_peers(scenario, engine, 6)
+    base: Set[Peer] = set(peer_list[1:])
+
+    # Act.
+    result: Set[Peer] = engine_candidates.random_recommendation(peer_list[0], base, 3)
+
+    # Assert.
+    assert len(result) == 3
+    assert result.issubset(base)
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_random_recommendation__whole_base(scenario: Scenario, engine: Engine) -> None:
+    """
+    Test when the target number is no smaller than the base size, so the whole base is returned.
+    """
+    # Arrange.
+    peer_list: List[Peer] = create_test_peers(scenario, engine, 4)
+    base: Set[Peer] = set(peer_list[1:])
+
+    # Act.
+    result: Set[Peer] = engine_candidates.random_recommendation(peer_list[0], base, 10)
+
+    # Assert.
+    assert result == base
+    # the returned set should be a different set object from the base.
+    assert result is not base
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_random_recommendation__error(scenario: Scenario, engine: Engine) -> None:
+    """
+    Test when the base is empty or the target number is zero.
+    """
+    peer_list: List[Peer] = create_test_peers(scenario, engine, 2)
+    with pytest.raises(ValueError):
+        engine_candidates.random_recommendation(peer_list[0], set(), 3)
+    with pytest.raises(ValueError):
+        engine_candidates.random_recommendation(peer_list[0], {peer_list[1]}, 0)
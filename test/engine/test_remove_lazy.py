@@ -2,8 +2,8 @@
 This module contains unit tests of remove_lazy().
 """
 
+import array
 from typing import List
-from collections import deque
 import pytest
 from node import Peer
 import engine_candidates
@@ -32,8 +32,10 @@ def test_remove_lazy(scenario: Scenario, engine: Engine):
     # but neighbor 1's lazy_round will increase by 1, and reach 6.
     neighbor_instance_list[0].lazy_round = 4
     neighbor_instance_list[1].lazy_round = 5
-    neighbor_instance_list[0].share_contribution = deque([0, 0, 7])
-    neighbor_instance_list[1].share_contribution = deque([1, 2, 0])
+    neighbor_instance_list[0].share_contribution = array.array("d", [0, 0])
+    neighbor_instance_list[0].current_contribution = 7
+    neighbor_instance_list[1].share_contribution = array.array("d", [1, 2])
+    neighbor_instance_list[1].current_contribution = 0
 
     # Act.
     # Neighbor 1 will be deleted.
@@ -110,10 +110,24 @@ CASE_4 = CaseType(
     expected_seqs=(497, 498, 499, 0, 1, 2, 3, 4),
 )
 
+# In case 5, there is no optimistic choice, so only the "mutual" number of highly scored peers
+# will be selected (in this case, they are peer 497-499).
+
+CASE_5 = CaseType(
+    scenario=SCENARIO_SAMPLE,
+    engine=ENGINE_SAMPLE,
+    num_neighbors=500,
+    mutual=3,
+    optimistic=0,
+    time_now=100,
+    expected_length=3,
+    expected_seqs=(497, 498, 499),
+)
+
 
 @pytest.mark.parametrize(
     "scenario, engine, num_neighbors, mutual, optimistic, time_now, expected_length, expected_seqs",
-    [CASE_1, CASE_2, CASE_3, CASE_4],
+    [CASE_1, CASE_2, CASE_3, CASE_4, CASE_5],
 )
 def test_tit_for_tat__no_zero_contributors(
     scenario: Scenario,
@@ -217,6 +231,40 @@ def test_tit_for_tat__zero_contributors(scenario, engine, monkeypatch):
         assert peer.seq in (5, 6, 7, 8, 9, 0, 1, 2)
 
 
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_tit_for_tat__zero_contributors_no_optimistic(scenario, engine):
+    """
+    This tests the case with a number of zero-contributors and no optimistic choices.
+    Zero-contributors can never be put into mutual helpers, and there are no other choices,
+    so only the positive-scored neighbors are selected.
+    """
+    peer = create_a_test_peer(scenario, engine)[0]
+    peer.birth_time = 0
+
+    neighbor_peers = create_test_peers(scenario, engine, 10)
+    for i in range(10):
+        neighbor_peers[i].seq = i
+        peer.add_neighbor(neighbor_peers[i])
+        neighbor_peers[i].add_neighbor(peer)
+        # peers 0-4 have a score of zero, and peers 5-9 have positive scores
+        peer.peer_neighbor_mapping[neighbor_peers[i]].score = 0 if i < 5 else i + 300
+
+    # Act
+    selected_peer_set = engine_candidates.tit_for_tat(
+        baby_ending=10,
+        mutual=7,
+        optimistic=0,
+        time_now=100,
+        time_start=peer.birth_time,
+        peer=peer,
+    )
+
+    # Assert
+    assert len(selected_peer_set) == 5
+    for peer in selected_peer_set:
+        assert peer.seq in (5, 6, 7, 8, 9)
+
+
 @pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
 def test_tit_for_tat__baby_peer(scenario, engine, monkeypatch):
     """
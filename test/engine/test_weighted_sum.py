@@ -2,8 +2,8 @@
 This module contains unit tests of weighted_sum().
 """
 
+import array
 from typing import List
-from collections import deque
 import pytest
 import engine_candidates
 from scenario import Scenario
@@ -27,8 +27,44 @@ def test_weighted_sum(scenario: Scenario, engine: Engine):
         scenario, engine
     )
 
-    neighbor_instance_list[0].share_contribution = deque([0, 0, 7])
-    neighbor_instance_list[1].share_contribution = deque([1, 2, 0])
+    # contributions in previous batches are [0, 0] and [1, 2], and in the current batch are
+    # 7 and 0, respectively.
+    neighbor_instance_list[0].share_contribution = array.array("d", [0, 0])
+    neighbor_instance_list[0].current_contribution = 7
+    neighbor_instance_list[1].share_contribution = array.array("d", [1, 2])
+    neighbor_instance_list[1].current_contribution = 0
+
+    weights: List[float] = [1.0, 0.5, 0.25]
+
+    # Act.
+    engine_candidates.weighted_sum(discount=weights, peer=peer)
+
+    # Assert.
+    assert neighbor_instance_list[0].score == pytest.approx(7 / 4)
+    assert neighbor_instance_list[1].score == pytest.approx(2)
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_weighted_sum__rotated_record(scenario: Scenario, engine: Engine):
+    """
+    Unit test of weighted_sum() when the head of the contribution record is not at the last
+    index, i.e., the circular buffer has been rotated.
+    """
+
+    # Arrange.
+
+    peer, _, neighbor_instance_list = create_a_peer_and_two_neighbors_helper(
+        scenario, engine
+    )
+
+    # Same records as the test above, from the oldest batch to the current one, but stored in
+    # rotated positions.
+    neighbor_instance_list[0].share_contribution = array.array("d", [0, 0])
+    neighbor_instance_list[0].head = 0
+    neighbor_instance_list[0].current_contribution = 7
+    neighbor_instance_list[1].share_contribution = array.array("d", [2, 1])
+    neighbor_instance_list[1].head = 0
+    neighbor_instance_list[1].current_contribution = 0
 
     weights: List[float] = [1.0, 0.5, 0.25]
 
@@ -2,8 +2,8 @@
 This module contains unit tests of add_neighbor().
 """
 
-import collections
-from typing import List, Deque
+import array
+from typing import List
 import pytest
 
 from node import Peer, Neighbor
@@ -44,10 +44,11 @@ def test_add_neighbor__normal(scenario, engine) -> None:
     assert neighbor.engine == engine
     assert neighbor.est_time == peer_list[0].local_clock
     assert neighbor.preference is None
-    expected_score_sheet: Deque = collections.deque()
-    for _ in range(engine.score_length):
-        expected_score_sheet.append(0.0)
-    assert neighbor.share_contribution == expected_score_sheet
+    assert neighbor.current_contribution == pytest.approx(0.0)
+    assert neighbor.share_contribution == array.array(
+        "d", [0.0] * (engine.score_length - 1)
+    )
+    assert neighbor.head == engine.score_length - 2
     assert neighbor.score == pytest.approx(0.0)
     assert neighbor.lazy_round == 0
 
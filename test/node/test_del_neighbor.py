@@ -10,7 +10,7 @@ receive_order_internal() and store_orders() functions, which we test in separate
 from typing import List
 import pytest
 
-from message import Order
+from message import Order, OrderInfo
 from node import Peer
 
 from ..__init__ import (
@@ -193,3 +193,58 @@ def test_del_neighbor_with_remove_order__multi_pending_orderinfo(
     assert (
         my_peer.order_pending_orderinfo_mapping[order][0].prev_owner == neighbor_list[1]
     )
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_del_neighbor_with_remove_order__adjacent_pending_orderinfo(
+    scenario, engine
+) -> None:
+    """
+    Test if there are two adjacent orderinfos from the deleted neighbor in the pending list.
+    Both of them should be removed.
+    """
+
+    # Arrange.
+
+    # create my_peer and neighbors. Later, neighbor_list[0] will be deleted.
+    my_peer: Peer = create_a_test_peer(scenario, engine)[0]
+    neighbor_list: List[Peer] = create_test_peers(scenario, engine, 2)
+    for neighbor in neighbor_list:
+        my_peer.add_neighbor(neighbor)
+        neighbor.add_neighbor(my_peer)
+
+    # new order.
+    order: Order = create_a_test_order(scenario)
+    for neighbor in neighbor_list:
+        neighbor.receive_order_external(order)
+        # Manually set verification done
+        neighbor.send_orders_to_on_chain_check(neighbor.local_clock)
+        neighbor.store_orders()
+
+    # my_peer has the order from neighbor 0 in the pending table.
+    my_peer.receive_order_internal(neighbor_list[0], order)
+    # receive_order_internal() does not accept a second copy from the same neighbor, so we
+    # manually put another copy from neighbor 0 right after the first one.
+    my_peer.order_pending_orderinfo_mapping[order].append(
+        OrderInfo(
+            engine=engine,
+            order=order,
+            master=my_peer,
+            arrival_time=my_peer.local_clock,
+            prev_owner=neighbor_list[0],
+        )
+    )
+    my_peer.receive_order_internal(neighbor_list[1], order)
+
+    # Act.
+
+    # my_peer deletes neighbor 0 and cancels orders from it.
+    my_peer.del_neighbor(neighbor_list[0], remove_order=True)
+
+    # Assert.
+
+    # Only the copy from neighbor 1 is left in the pending table.
+    assert len(my_peer.order_pending_orderinfo_mapping[order]) == 1
+    assert (
+        my_peer.order_pending_orderinfo_mapping[order][0].prev_owner == neighbor_list[1]
+    )
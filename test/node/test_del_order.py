@@ -41,6 +41,8 @@ def test_del_order__in_storage(scenario, engine) -> None:
 
     # Assert.
     assert new_order not in my_peer.order_orderinfo_mapping
+    assert new_order not in my_peer.new_order_set
+    assert new_order not in my_peer.old_order_set
 
 
 @pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
@@ -58,6 +58,7 @@ def test_peer(scenario, engine) -> None:
 
     # assert my_peer's storage for order and orderinfo
     assert my_peer.new_order_set == order_set
+    assert my_peer.old_order_set == set()
 
     assert len(my_peer.order_orderinfo_mapping) == 5
     for order in order_set:
@@ -131,3 +131,29 @@ def test_receive_order_internal_duplicate_from_others(scenario, engine):
 
     # Assert. Both copies should be in the pending table.
     assert len(peer_list[0].order_pending_orderinfo_mapping[order]) == 2
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_receive_orders_internal__batch(scenario, engine):
+    """
+    This tests receiving a batch of internal orders from a neighbor in one call. It should be the
+    same as receiving them one by one.
+    """
+
+    # Arrange.
+    peer_list: List[Peer] = create_test_peers(scenario, engine, 2)
+    peer_list[0].add_neighbor(peer_list[1])
+    peer_list[1].add_neighbor(peer_list[0])
+    order_list: List[Order] = [create_a_test_order(scenario) for _ in range(3)]
+    for order in order_list:
+        peer_list[1].receive_order_external(order)
+    peer_list[1].send_orders_to_on_chain_check(peer_list[1].local_clock)
+    peer_list[1].store_orders()
+
+    # Act. The first order is sent twice in the batch.
+    peer_list[0].receive_orders_internal(peer_list[1], order_list + order_list[:1])
+
+    # Assert. All orders are in the pending table, and the duplicate is not stored twice.
+    for order in order_list:
+        assert len(peer_list[0].order_pending_orderinfo_mapping[order]) == 1
+        assert peer_list[0] in order.hesitators
@@ -51,7 +51,7 @@ def test_scoring_system_penalty_a(scenario, engine, monkeypatch) -> None:
     neighbor.store_orders()
 
     # clear score sheet for neighbors
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # define fake functions.
     # always store orders
@@ -113,7 +113,7 @@ def test_scoring_system_reward_a(scenario, engine, monkeypatch) -> None:
     my_peer.store_orders()
 
     # clear score sheet for neighbor
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # always store orders
     monkeypatch.setattr(engine, "store_or_discard_orders", always_store_orders)
@@ -169,7 +169,7 @@ def test_scoring_system_reward_b(scenario, engine, monkeypatch) -> None:
     my_peer.store_orders()
 
     # clear score sheet for neighbor
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # Always store orders
     monkeypatch.setattr(engine, "store_or_discard_orders", always_store_orders)
@@ -220,7 +220,7 @@ def test_scoring_system_penalty_b(scenario, engine, monkeypatch) -> None:
     my_peer.receive_order_internal(neighbor, order)
 
     # clear score sheet for neighbor
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # Always store orders
     monkeypatch.setattr(engine, "store_or_discard_orders", always_store_orders)
@@ -265,7 +265,7 @@ def test_scoring_system_reward_c(scenario, engine, monkeypatch) -> None:
     neighbor.store_orders()
 
     # clear score sheet for neighbors
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # define fake functions.
 
@@ -326,7 +326,7 @@ def test_scoring_system_reward_d(scenario, engine, monkeypatch) -> None:
     my_peer.receive_order_internal(competitor, order)
 
     # clear score sheet for neighbor
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # define fake functions.
 
@@ -390,7 +390,7 @@ def test_scoring_system_reward_e(scenario, engine, monkeypatch) -> None:
     my_peer.receive_order_internal(competitor, order)
 
     # clear score sheet for neighbor
-    my_peer.peer_neighbor_mapping[neighbor].share_contribution[-1] = 0
+    my_peer.peer_neighbor_mapping[neighbor].current_contribution = 0
 
     # define fake functions.
 
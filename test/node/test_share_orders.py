@@ -52,7 +52,7 @@ def test_share_orders__normal(scenario, engine, monkeypatch) -> None:
     neighbor_list = create_test_peers(scenario, engine, 3)
     neighbor_list[2].seq = 101
 
-    unlucky_order = random.sample(order_set, 1)[0]
+    unlucky_order = random.choice(list(order_set))
     unlucky_order.seq = 280
 
     for neighbor in neighbor_list:
@@ -69,6 +69,7 @@ def test_share_orders__normal(scenario, engine, monkeypatch) -> None:
     assert len(order_sharing_set) == 4
     assert unlucky_order not in order_sharing_set
     assert peer.new_order_set == set()
+    assert peer.old_order_set == set(peer.order_orderinfo_mapping)
 
 
 @pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
@@ -90,3 +91,5 @@ def test_share_orders__free_rider(scenario, engine) -> None:
     # Act and Assert.
     free_rider.send_orders_to_on_chain_check(free_rider.local_clock)
     assert free_rider.share_orders(0) == (set(), set())
+    assert free_rider.new_order_set == set()
+    assert free_rider.old_order_set == set(free_rider.order_orderinfo_mapping)
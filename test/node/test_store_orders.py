@@ -37,6 +37,54 @@ def test_store_orders__single_orderinfo(scenario, engine) -> None:
     assert order in peer.order_orderinfo_mapping
 
 
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_store_orders__order_left_pending_table(scenario, engine) -> None:
+    """
+    This one tests the case where an order under verification has left the pending table before
+    its verification completes. It should be skipped, and other orders are stored as usual.
+    """
+    # Arrange.
+    peer: Peer = create_a_test_peer(scenario, engine)[0]
+    order_list: List[Order] = [create_a_test_order(scenario) for _ in range(2)]
+    for order in order_list:
+        peer.receive_order_external(order)
+    peer.send_orders_to_on_chain_check(peer.local_clock)
+    # the first order is deleted from the pending table, but is still under verification.
+    peer.del_order(order_list[0])
+
+    # Act.
+    peer.store_orders()
+
+    # Assert.
+    assert order_list[0] not in peer.order_orderinfo_mapping
+    assert order_list[1] in peer.order_orderinfo_mapping
+    assert not peer.order_pending_orderinfo_mapping
+
+
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_store_orders__nothing_to_verify(scenario, engine, monkeypatch) -> None:
+    """
+    This one tests the case where no order completes its verification at this time. The engine
+    should not be asked to make any storage decision.
+    """
+    # Arrange.
+    peer: Peer = create_a_test_peer(scenario, engine)[0]
+    pending_orderinfo_mapping = dict(peer.order_pending_orderinfo_mapping)
+    peer.send_orders_to_on_chain_check(peer.local_clock)
+    peer.verification_time_orders_mapping[peer.local_clock].clear()
+
+    def fake_storage_decision(_node):
+        raise RuntimeError("Storage decision should not be made.")
+
+    monkeypatch.setattr(engine, "store_or_discard_orders", fake_storage_decision)
+
+    # Act.
+    peer.store_orders()
+
+    # Assert.
+    assert peer.order_pending_orderinfo_mapping == pending_orderinfo_mapping
+
+
 @pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
 def test_store_orders__multi_orderinfo(scenario, engine, monkeypatch) -> None:
     """
@@ -109,6 +157,77 @@ def test_store_orders__multi_orderinfo(scenario, engine, monkeypatch) -> None:
     assert peer.order_pending_orderinfo_mapping == {}
 
 
+@pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
+def test_store_orders__store_later_orderinfo(scenario, engine, monkeypatch) -> None:
+    """
+    This one tests the case where an order has multiple orderinfo instances in the pending table
+    and the one to be stored is not the first one in the list.
+    """
+    # Arrange.
+
+    # Create a peer and three neighbors for this peer. They will be connected.
+    peer: Peer = create_a_test_peer(scenario, engine)[0]
+    neighbor_list: List[Peer] = create_test_peers(scenario, engine, 3)
+
+    # create an order
+    order: Order = create_a_test_order(scenario)
+
+    # neighbors store this order and are connected to peer.
+    for neighbor in neighbor_list:
+        neighbor.add_neighbor(peer)
+        peer.add_neighbor(neighbor)
+        neighbor.receive_order_external(order)
+        neighbor.send_orders_to_on_chain_check(neighbor.local_clock)
+        neighbor.store_orders()
+
+    # manually put the order into peer's pending table, one orderinfo from each neighbor.
+    for neighbor in neighbor_list:
+        orderinfo = OrderInfo(
+            engine=engine,
+            order=order,
+            master=neighbor,
+            arrival_time=peer.birth_time,
+            priority=None,
+            prev_owner=neighbor,
+            novelty=0,
+        )
+        if order not in peer.order_pending_orderinfo_mapping:
+            peer.order_pending_orderinfo_mapping[order] = [orderinfo]
+            peer.verification_time_orders_mapping[0].append(order)
+        else:
+            peer.order_pending_orderinfo_mapping[order].append(orderinfo)
+    order.hesitators.add(peer)
+
+    # manually set storage_decisions for the order.
+    # Store neighbor_2's orderinfo instance, which is the last one in the pending list.
+    for orderinfo in peer.order_pending_orderinfo_mapping[order]:
+        orderinfo.storage_decision = orderinfo.prev_owner == neighbor_list[2]
+
+    # Disable engine.store_or_discard_orders which will otherwise
+    # change the values for orderinfo.storage_decision
+    def fake_storage_decision(_node):
+        pass
+
+    monkeypatch.setattr(engine, "store_or_discard_orders", fake_storage_decision)
+
+    peer.send_orders_to_on_chain_check(peer.local_clock)
+
+    # Act.
+    peer.store_orders()
+
+    # Assert.
+
+    # order should have been stored and it is the right version.
+    assert peer.order_orderinfo_mapping[order].prev_owner == neighbor_list[2]
+    # peer's pending table should have been cleared.
+    assert not peer.order_pending_orderinfo_mapping
+    # the sender of the stored copy gets reward_d, and the other senders get reward_e.
+    neighbor_mapping = peer.peer_neighbor_mapping
+    assert neighbor_mapping[neighbor_list[2]].current_contribution == engine.reward_d
+    assert neighbor_mapping[neighbor_list[0]].current_contribution == engine.reward_e
+    assert neighbor_mapping[neighbor_list[1]].current_contribution == engine.reward_e
+
+
 @pytest.mark.parametrize("scenario,engine", [(SCENARIO_SAMPLE, ENGINE_SAMPLE)])
 def test_store_orders__do_not_store(scenario, engine, monkeypatch) -> None:
     """
@@ -175,6 +175,63 @@ def test_single_peer_order_receipt_ratio__normal(
             assert receipt_ratio[idx] == expected_result[idx]
 
 
+@pytest.mark.parametrize(
+    "scenario, engine, num_order, order_birth_time_list_normal, order_id_owned_by_peer, "
+    "order_id_in_stat, max_age, window, expected_result",
+    [CASE_1, CASE_2],
+)
+def test_single_peer_order_receipt_ratio__given_order_stat(
+    scenario: Scenario,
+    engine: Engine,
+    num_order: int,
+    order_birth_time_list_normal: List[int],
+    order_id_owned_by_peer: List[int],
+    order_id_in_stat: List[int],
+    max_age: int,
+    window: int,
+    expected_result: SpreadingRatio,
+):
+    """
+    This function tests normal cases where the order statistics on age is calculated in advance
+    and passed to the function.
+    """
+
+    # Arrange
+    peer, order_set = arrange_for_test(
+        scenario=scenario,
+        engine=engine,
+        num_order=num_order,
+        order_birth_time_list=order_birth_time_list_normal,
+        order_id_owned_by_peer=order_id_owned_by_peer,
+        order_id_in_stat=order_id_in_stat,
+    )
+    order_stat_based_on_age: List[int] = performance_candidates.order_num_stat_on_age(
+        cur_time=100,
+        max_age_to_track=max_age,
+        statistical_window=window,
+        order_set=order_set,
+    )
+
+    # Act
+    receipt_ratio = performance_candidates.single_peer_order_receipt_ratio(
+        cur_time=100,
+        peer=peer,
+        max_age_to_track=max_age,
+        statistical_window=window,
+        order_set=order_set,
+        order_stat_based_on_age=order_stat_based_on_age,
+    )
+
+    # Assert.
+    assert len(receipt_ratio) == len(expected_result)
+    length = len(receipt_ratio)
+    for idx in range(length):
+        try:
+            assert receipt_ratio[idx] == pytest.approx(expected_result[idx])
+        except TypeError:  # at least one is None
+            assert receipt_ratio[idx] == expected_result[idx]
+
+
 # Case 3 is also similar but there's one order with a negative age. Error expected.
 
 CASE_3 = copy.deepcopy(CASE_2)
@@ -0,0 +1,58 @@
+"""
+This module contains unit tests of seeding random number generators in SingleRun.__init__().
+"""
+
+import random
+import numpy
+import pytest
+
+from single_run import SingleRun
+from ..__init__ import SCENARIO_SAMPLE, ENGINE_SAMPLE, PERFORMANCE_SAMPLE
+
+
+@pytest.mark.parametrize(
+    "scenario, engine, performance",
+    [(SCENARIO_SAMPLE, ENGINE_SAMPLE, PERFORMANCE_SAMPLE)],
+)
+def test_seed(scenario, engine, performance):
+    """
+    This tests that two SingleRun instances with the same seed generate the same random values,
+    and an instance with a different seed generates different ones.
+    """
+
+    # Arrange and Act.
+    single_run_1 = SingleRun(scenario, engine, performance, seed=1)
+    events_1 = single_run_1.generate_events_during_whole_process()
+    single_run_2 = SingleRun(scenario, engine, performance, seed=1)
+    events_2 = single_run_2.generate_events_during_whole_process()
+    single_run_3 = SingleRun(scenario, engine, performance, seed=2)
+    events_3 = single_run_3.generate_events_during_whole_process()
+
+    # Assert.
+    assert single_run_1.server_response_time == single_run_2.server_response_time
+    assert events_1 == events_2
+    assert events_1 != events_3
+
+
+@pytest.mark.parametrize(
+    "scenario, engine, performance",
+    [(SCENARIO_SAMPLE, ENGINE_SAMPLE, PERFORMANCE_SAMPLE)],
+)
+def test_seed__none(scenario, engine, performance):
+    """
+    This tests that SingleRun instances without a seed keep the seeding done by the caller.
+    """
+
+    # Arrange and Act.
+    random.seed(1)
+    numpy.random.seed(1)
+    single_run_1 = SingleRun(scenario, engine, performance)
+    random_value_1 = random.random()
+    random.seed(1)
+    numpy.random.seed(1)
+    single_run_2 = SingleRun(scenario, engine, performance)
+    random_value_2 = random.random()
+
+    # Assert.
+    assert single_run_1.server_response_time == single_run_2.server_response_time
+    assert random_value_1 == random_value_2